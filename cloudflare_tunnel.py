@@ -8,8 +8,11 @@ import threading
 import signal
 import sys
 import os
+import atexit
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from config import CONFIG
 
 # ============================================================================
@@ -20,6 +23,15 @@ CLOUDFLARED_PATH = "/usr/local/bin/cloudflared"  # Adjust if cloudflared is in a
 TUNNEL_LOG_FILE = "/tmp/cloudflared_tunnel.log"
 TUNNEL_URL_FILE = "/tmp/cloudflared_tunnel_url.txt"
 LOCAL_PORT = 5000  # The port your WiFi controller dashboard runs on
+LOG_FLUSH_INTERVAL = 5  # Seconds between log file flushes once the URL is captured
+TUNNEL_URL_PATTERN = re.compile(r'https://[a-zA-Z0-9-]+\.trycloudflare\.com')
+WEBHOOK_URL = 'https://rock.lcbcchurch.com/Webhooks/Lava.ashx/WiFiSwitchAPI'
+WEBHOOK_TIMEOUT = (3, 10)  # (connect, read) seconds
+
+# Shared HTTP session so webhook calls reuse the TCP/TLS connection
+HTTP_SESSION = requests.Session()
+HTTP_SESSION.mount('https://', HTTPAdapter(pool_connections=2, pool_maxsize=4,
+                                           max_retries=Retry(total=3, backoff_factor=0.3)))
 
 # ============================================================================
 # User-Defined Function - Called when tunnel URL is captured
@@ -61,7 +73,7 @@ def on_tunnel_ready(tunnel_url):
         'Authorization-Token': CONFIG['device']['authorization_token']
     }
 
-    res = requests.post('https://rock.lcbcchurch.com/Webhooks/Lava.ashx/WiFiSwitchAPI', data=data, headers=headers)
+    res = HTTP_SESSION.post(WEBHOOK_URL, data=data, headers=headers, timeout=WEBHOOK_TIMEOUT)
     print(json.dumps(res.json(), indent=4))
 
     # Example: Send to a webhook (uncomment and customize)
@@ -87,6 +99,8 @@ class CloudflareTunnelManager:
         self.log_file = None
         self.running = False
         self.url_captured = threading.Event()
+        # Flush whatever log file is open at exit; registered once, not per tunnel start
+        atexit.register(self._flush_log)
 
     def start_tunnel(self):
         """Start cloudflared tunnel and monitor for URL"""
@@ -100,7 +114,7 @@ class CloudflareTunnelManager:
 
         try:
             # Open log file
-            self.log_file = open(TUNNEL_LOG_FILE, 'w')
+            self.log_file = open(TUNNEL_LOG_FILE, 'w', buffering=8192)
 
             # Start cloudflared tunnel
             cmd = [
@@ -113,8 +127,7 @@ class CloudflareTunnelManager:
                 cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                universal_newlines=True,
-                bufsize=1
+                universal_newlines=True
             )
 
             self.running = True
@@ -131,6 +144,7 @@ class CloudflareTunnelManager:
                 return True
             else:
                 print("⚠️  Warning: Tunnel URL not captured within 30 seconds")
+                self._flush_log()
                 return False
 
         except Exception as e:
@@ -138,38 +152,45 @@ class CloudflareTunnelManager:
             return False
 
     def _monitor_output(self):
-        """Monitor cloudflared output for tunnel URL"""
-        url_pattern = re.compile(r'https://[a-zA-Z0-9-]+\.trycloudflare\.com')
-
+        """Monitor cloudflared output for tunnel URL, then keep draining it into the log"""
         try:
-            for line in iter(self.process.stdout.readline, ''):
-                if not line:
-                    break
-
-                # Write to log file
+            # Phase 1: echo and search each line until the tunnel URL shows up
+            for line in self.process.stdout:
+                # Write to log file (flushed once the URL is captured)
                 if self.log_file:
                     self.log_file.write(line)
-                    self.log_file.flush()
 
                 # Print to console
                 print(f"[cloudflared] {line.strip()}")
 
                 # Search for tunnel URL
-                if not self.tunnel_url:
-                    match = url_pattern.search(line)
-                    if match:
-                        self.tunnel_url = match.group(0)
-                        print(f"\n{'='*60}")
-                        print(f"🎯 TUNNEL URL CAPTURED: {self.tunnel_url}")
-                        print(f"{'='*60}\n")
-
-                        # Call user-defined function
-                        try:
-                            on_tunnel_ready(self.tunnel_url)
-                        except Exception as e:
-                            print(f"❌ Error in on_tunnel_ready callback: {e}")
-
-                        self.url_captured.set()
+                match = TUNNEL_URL_PATTERN.search(line)
+                if match:
+                    self.tunnel_url = match.group(0)
+                    self._flush_log()
+                    print(f"\n{'='*60}")
+                    print(f"🎯 TUNNEL URL CAPTURED: {self.tunnel_url}")
+                    print(f"{'='*60}\n")
+
+                    # Call user-defined function
+                    try:
+                        on_tunnel_ready(self.tunnel_url)
+                    except Exception as e:
+                        print(f"❌ Error in on_tunnel_ready callback: {e}")
+
+                    self.url_captured.set()
+                    break
+
+            # Phase 2: URL is known, just copy the remaining output to the log file
+            # (the pipe must still be drained or cloudflared will block on write)
+            last_flush = time.monotonic()
+            for line in self.process.stdout:
+                if self.log_file:
+                    self.log_file.write(line)
+                    now = time.monotonic()
+                    if now - last_flush >= LOG_FLUSH_INTERVAL:
+                        self.log_file.flush()
+                        last_flush = now
 
         except Exception as e:
             print(f"❌ Error monitoring output: {e}")
@@ -177,10 +198,19 @@ class CloudflareTunnelManager:
             if self.log_file:
                 self.log_file.close()
 
+    def _flush_log(self):
+        """Push buffered log lines to the log file"""
+        try:
+            if self.log_file and not self.log_file.closed:
+                self.log_file.flush()
+        except Exception as e:
+            print(f"⚠️  Could not flush log file: {e}")
+
     def stop_tunnel(self):
         """Stop the cloudflared tunnel"""
         print("\n🛑 Stopping Cloudflare Tunnel...")
         self.running = False
+        self._flush_log()
 
         if self.process:
             try:
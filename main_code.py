@@ -1,41 +1,9 @@
 from random import random
 import RPi.GPIO as GPIO
-import time
+import threading
 
 BUTTON_PIN = 23
 BUTTON_PIN2 = 24
-GPIO.setmode(GPIO.BCM)
-GPIO.setup(BUTTON_PIN, GPIO.IN, pull_up_down=GPIO.PUD_UP)
-GPIO.setup(BUTTON_PIN2, GPIO.IN, pull_up_down=GPIO.PUD_UP)
-
-prevState = GPIO.input(BUTTON_PIN)
-prevState2 = GPIO.input(BUTTON_PIN2)
-wiFiState = getWiFiState()
-
-print('initialized')
-try:
-    while True:
-        time.sleep(0.01)
-        buttonState = GPIO.input(BUTTON_PIN)
-        if buttonState != prevState:
-            print(buttonState)
-            prevState = buttonState
-
-            if buttonState == 0:
-                setWiFiOn()
-
-
-        
-        buttonState2 = GPIO.input(BUTTON_PIN2)
-        if buttonState2 != prevState2:
-            print(f'{buttonState2} button 2')
-            prevState2 = buttonState2
-
-            if buttonState2 == 0:
-                setWiFiOff()
-            
-except KeyboardInterrupt:
-    GPIO.cleanup()
 
 
 def getWiFiState():
@@ -49,4 +17,23 @@ def setWiFiOn():
 def setWiFiOff():
     print("WiFi turned OFF")
     wiFiState = False
-    #connect to ssh using credentials saved in file
\ No newline at end of file
+    #connect to ssh using credentials saved in file
+
+
+GPIO.setmode(GPIO.BCM)
+GPIO.setup(BUTTON_PIN, GPIO.IN, pull_up_down=GPIO.PUD_UP)
+GPIO.setup(BUTTON_PIN2, GPIO.IN, pull_up_down=GPIO.PUD_UP)
+
+wiFiState = getWiFiState()
+
+# Buttons pull the pin low when pressed - react to the falling edge only,
+# bouncetime filters out contact bounce
+GPIO.add_event_detect(BUTTON_PIN, GPIO.FALLING, callback=lambda channel: setWiFiOn(), bouncetime=200)
+GPIO.add_event_detect(BUTTON_PIN2, GPIO.FALLING, callback=lambda channel: setWiFiOff(), bouncetime=200)
+
+print('initialized')
+try:
+    # Callbacks run on the RPi.GPIO thread, just park the main thread
+    threading.Event().wait()
+except KeyboardInterrupt:
+    GPIO.cleanup()
@@ -1,7 +1,16 @@
 import requests
 import json
+import pprint
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from config import CONFIG
 
+WEBHOOK_URL = 'https://rock.lcbcchurch.com/Webhooks/Lava.ashx/WiFiSwitchAPI'
+WEBHOOK_TIMEOUT = (3, 10)  # (connect, read) seconds
+
+HTTP_SESSION = requests.Session()
+HTTP_SESSION.mount('https://', HTTPAdapter(max_retries=Retry(total=3, backoff_factor=0.3)))
+
 apiHeader = {
     'Authorization-Token': CONFIG['device']['authorization_token']
 }
@@ -13,58 +22,17 @@ data = {
 }
 
 
-res = requests.post('https://rock.lcbcchurch.com/Webhooks/Lava.ashx/WiFiSwitchAPI', data=data, headers=apiHeader)
+res = HTTP_SESSION.post(WEBHOOK_URL, data=data, headers=apiHeader, timeout=WEBHOOK_TIMEOUT)
 
 print(json.dumps(res.json(), indent=2))
 
 CONFIG['device']['device_id'] = res.json().get('deviceId', '')
 
 
-def format_python_value(value, indent_level=0):
-    """
-    Format a Python value as valid Python code string.
-    Handles dictionaries, lists, strings, booleans, None, numbers.
-    """
-    indent = '    ' * indent_level
-    next_indent = '    ' * (indent_level + 1)
-    
-    if isinstance(value, dict):
-        if not value:
-            return '{}'
-        items = []
-        for k, v in value.items():
-            key_str = f"'{k}'" if isinstance(k, str) else str(k)
-            val_str = format_python_value(v, indent_level + 1)
-            items.append(f"{next_indent}{key_str}: {val_str}")
-        return '{\n' + ',\n'.join(items) + f'\n{indent}}}'
-    elif isinstance(value, list):
-        if not value:
-            return '[]'
-        items = []
-        for item in value:
-            item_str = format_python_value(item, indent_level + 1)
-            items.append(f"{next_indent}{item_str}")
-        return '[\n' + ',\n'.join(items) + f'\n{indent}]'
-    elif isinstance(value, str):
-        # Escape single quotes in strings
-        escaped = value.replace("'", "\\'").replace('\n', '\\n').replace('\r', '\\r')
-        return f"'{escaped}'"
-    elif isinstance(value, bool):
-        return 'True' if value else 'False'
-    elif value is None:
-        return 'None'
-    elif isinstance(value, (int, float)):
-        return str(value)
-    else:
-        # Fallback for other types - convert to string representation
-        return repr(value)
-
-
 def save_config_to_file(config_dict, filename='config.py'):
     """Save config dictionary to a Python file with proper formatting"""
+    # pformat emits valid Python literals (True/False/None, escaped strings)
     with open(filename, 'w') as f:
-        f.write('CONFIG = ')
-        f.write(format_python_value(config_dict))
-        f.write('\n')
+        f.write('CONFIG = ' + pprint.pformat(config_dict, indent=4, sort_dicts=False, width=100) + '\n')
 
 save_config_to_file(CONFIG, 'config.py')
\ No newline at end of file